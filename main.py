@@ -11,16 +11,17 @@ import random
 import time
 import os
 import json
-
-# Initialize Pygame
-pygame.init()
-pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+import functools
 
 # Constants - Sunrise Phase Colors
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 120  # Increased for smoother movement
 
+# Crater merging
+CRATER_OVERLAP_FACTOR = 0.8  # Craters merge when closer than 80% of their combined radii
+MAX_CRATERS = 50             # Crater records kept for merging, oldest are dropped
+
 # Sunrise Color Palette
 COLORS = {
     'sky_upper': (135, 206, 250),      # Crisp bright blue sky
@@ -526,6 +527,10 @@ class EffectsManager:
         """Clear all effects (useful for game reset)"""
         for system in self.particle_systems.values():
             system.clear()
+    
+    def get_particle_count(self):
+        """Get the total number of live particles across all systems"""
+        return sum(len(system.particles) for system in self.particle_systems.values())
 
 class AudioManager:
     """Centralized manager for all sound effects and audio"""
@@ -839,22 +844,21 @@ class Projectile:
         # Apply gravity
         self.velocity_y += 0.5
         
+        is_banana = self.weapon_type == "banana"
+        
         # Update visual effects
-        if self.weapon_type == "banana":
+        if is_banana:
             # Spinning animation
             self.rotation += 10
             if self.rotation >= 360:
                 self.rotation = 0
         
-        # Create trail effects
-        if effects_manager and self.weapon_type == "rocket":
-            effects_manager.create_projectile_trail(self.x, self.y, self.velocity_x, self.velocity_y, self.weapon_type, self.power_level)
-        elif effects_manager and self.weapon_type == "banana":
-            # Add subtle sparkle effect for banana
+        # Create trail effects (flame trail for rocket, subtle sparkle for banana)
+        if effects_manager and (is_banana or self.weapon_type == "rocket"):
             effects_manager.create_projectile_trail(self.x, self.y, self.velocity_x, self.velocity_y, self.weapon_type, self.power_level)
         
         # Banana timer countdown
-        if self.weapon_type == "banana":
+        if is_banana:
             self.timer -= 1
             if self.timer <= 0:
                 self.explode(terrain, players, effects_manager, audio_manager)
@@ -1114,6 +1118,16 @@ class Player:
         self.charging_power = False
         self.current_weapon = "rocket"  # "rocket", "banana", "melee"
         
+    def reset(self, x, y, velocity_x=0, velocity_y=0, on_ground=False):
+        """Reset position and movement state so the player can be reused"""
+        self.x = x
+        self.y = y
+        self.velocity_x = velocity_x
+        self.velocity_y = velocity_y
+        self.on_ground = on_ground
+        self.is_jumping = False
+        self.moving = False
+    
     def update(self, terrain, audio_manager=None):
         """Pure arcade physics - instant movement, tight jumps, no sliding"""
         old_y = self.y
@@ -1335,6 +1349,104 @@ class Player:
         pygame.draw.rect(screen, health_color, 
                         (health_x, health_y, current_health_width, health_height))
 
+class Crater:
+    """Lightweight crater record with dict-style read access for compatibility"""
+    
+    __slots__ = ('x', 'y', 'radius', 'creation_time')
+    
+    def __init__(self, x, y, radius, creation_time=0):
+        self.x = x
+        self.y = y
+        self.radius = radius
+        self.creation_time = creation_time
+    
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key):
+        return key in self.__slots__
+    
+    def get(self, key, default=None):
+        """Dict-style get, e.g. crater.get('creation_time', 0)"""
+        return getattr(self, key) if key in self.__slots__ else default
+    
+    def copy(self):
+        """Return an independent copy of this crater"""
+        return Crater(self.x, self.y, self.radius, self.creation_time)
+    
+    def __repr__(self):
+        return (f"Crater(x={self.x}, y={self.y}, radius={self.radius}, "
+                f"creation_time={self.creation_time})")
+
+def _find_overlapping_crater_pairs(xs, ys, radii):
+    """Find index pairs (i < j) of overlapping craters using a uniform spatial hash grid
+    
+    Crater data is passed as parallel x/y/radius sequences so the pair scan
+    works on flat values instead of per-crater attribute lookups.
+    """
+    # Any overlapping pair is closer than the largest possible threshold,
+    # 2 * CRATER_OVERLAP_FACTOR * max radius, so cells of that size only need to be
+    # compared with their neighbours
+    cell_size = max(1, 2 * CRATER_OVERLAP_FACTOR * max(radii))
+    
+    buckets = {}
+    cells = []
+    for i in range(len(xs)):
+        cell = (int(xs[i] // cell_size), int(ys[i] // cell_size))
+        cells.append(cell)
+        buckets.setdefault(cell, []).append(i)
+    
+    pairs = []
+    for i, (cell_x, cell_y) in enumerate(cells):
+        x, y, radius = xs[i], ys[i], radii[i]
+        for offset_x in (-1, 0, 1):
+            for offset_y in (-1, 0, 1):
+                for j in buckets.get((cell_x + offset_x, cell_y + offset_y), ()):
+                    if j <= i:
+                        continue
+                    dx = x - xs[j]
+                    dy = y - ys[j]
+                    threshold = (radius + radii[j]) * CRATER_OVERLAP_FACTOR
+                    # Squared comparison avoids a sqrt per candidate pair
+                    if dx * dx + dy * dy < threshold * threshold:
+                        pairs.append((i, j))
+    
+    return pairs
+
+def _assign_crater_groups(xs, ys, radii):
+    """Assign every crater a group id so that overlapping craters share one
+    
+    Union-find over crater indices: one pass joins every overlapping pair, so
+    chains of craters collapse transitively. Works purely on flat x/y/radius
+    sequences and returns the root index of each crater's group.
+    """
+    parent = list(range(len(xs)))
+    rank = [0] * len(xs)
+    
+    def find(i):
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        # Path compression
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+    
+    for i, j in _find_overlapping_crater_pairs(xs, ys, radii):
+        root_i, root_j = find(i), find(j)
+        if root_i == root_j:
+            continue
+        # Union by rank
+        if rank[root_i] < rank[root_j]:
+            root_i, root_j = root_j, root_i
+        parent[root_j] = root_i
+        if rank[root_i] == rank[root_j]:
+            rank[root_i] += 1
+    
+    return [find(i) for i in range(len(xs))]
+
 class TerrainMap:
     """Enhanced terrain system with pixel-based destructible terrain"""
     
@@ -1351,17 +1463,34 @@ class TerrainMap:
             self.ground_level = height_map
             self.height_map = [height_map for _ in range(width)]
         
-        # Pixel-based terrain representation - True means terrain exists
-        self.terrain_pixels = [[False for _ in range(height)] for _ in range(width)]
+        # Pixel-based terrain representation - one int bitboard per column,
+        # bit y set means terrain exists at row y
+        self._full_column = (1 << height) - 1
+        self.terrain_pixels = []
         
         # Initialize solid ground based on height map
         for x in range(width):
             ground_height = self.height_map[x] if x < len(self.height_map) else self.ground_level
-            for y in range(int(ground_height), height):
-                self.terrain_pixels[x][y] = True
+            top = min(height, max(0, int(ground_height)))
+            self.terrain_pixels.append(self._full_column >> top << top)
+        
+        # From here on the height map holds the topmost solid pixel of every column
+        self._update_height_map()
+        self._base_height_map = self.height_map.copy()
         
         # List of craters for merging detection
         self.craters = []
+        # Crater list as it stood after the last merge
+        self._merged_craters = []
+    
+    def reset(self):
+        """Restore the original terrain in place, discarding all craters"""
+        full_column = self._full_column
+        self.terrain_pixels[:] = [full_column >> top << top
+                                  for top in self._base_height_map[:self.width]]
+        self.height_map[:] = self._base_height_map
+        self.craters.clear()
+        self._merged_craters = []
     
     def get_ground_height(self, x):
         """Get terrain height at x coordinate with interpolation"""
@@ -1369,18 +1498,7 @@ class TerrainMap:
         
         # For more accurate collision, check a small area around the point
         search_radius = 3
-        min_height = self.height_map[x_int]
-        
-        for dx in range(-search_radius, search_radius + 1):
-            check_x = x_int + dx
-            if 0 <= check_x < self.width:
-                # Find the topmost solid pixel in this column
-                for y in range(self.height):
-                    if self.terrain_pixels[check_x][y]:
-                        min_height = min(min_height, y)
-                        break
-        
-        return min_height
+        return min(self.height_map[max(0, x_int - search_radius):x_int + search_radius + 1])
     
     def get_accurate_ground_height(self, x, y_start=None):
         """Get precise ground height by scanning downward from a starting point"""
@@ -1390,11 +1508,13 @@ class TerrainMap:
             y_start = 0
         
         # Scan downward to find first solid pixel
-        for y in range(int(y_start), self.height):
-            if self.terrain_pixels[x_int][y]:
-                return y
+        y_start = max(0, int(y_start))
+        column = self.terrain_pixels[x_int] >> y_start
+        if not column:
+            return self.height  # If no solid ground found, return bottom
         
-        return self.height  # If no solid ground found, return bottom
+        # Lowest set bit is the first solid pixel below y_start
+        return y_start + (column & -column).bit_length() - 1
     
     def check_wall_collision(self, x, y, width, height):
         """Check if a rectangle collides with terrain walls (for crater sides)"""
@@ -1412,98 +1532,138 @@ class TerrainMap:
         """Check if terrain exists at specific pixel"""
         if x < 0 or x >= self.width or y < 0 or y >= self.height:
             return False
-        return self.terrain_pixels[int(x)][int(y)]
+        return (self.terrain_pixels[int(x)] >> int(y)) & 1 == 1
+    
+    def any_solid_in_column(self, x, y_start, y_end):
+        """Check if any terrain exists in column x between rows y_start and y_end-1"""
+        if x < 0 or x >= self.width:
+            return False
+        y_start = max(0, int(y_start))
+        y_end = min(self.height, int(y_end))
+        if y_start >= y_end:
+            return False
+        return (self.terrain_pixels[int(x)] >> y_start) & ((1 << (y_end - y_start)) - 1) != 0
     
-    def create_crater(self, center_x, center_y, radius):
+    def create_crater(self, center_x, center_y, radius, creation_time=None):
         """Create circular crater at impact point"""
+        x_start, x_end = self._carve_crater(center_x, center_y, radius, creation_time)
+        
+        # Update height map for the columns the crater touched
+        self._update_height_map(x_start, x_end)
+    
+    def create_craters_bulk(self, xs, ys, radii):
+        """Create several craters at once, updating the height map a single time"""
+        x_start, x_end = self.width, 0
+        for center_x, center_y, radius in zip(xs, ys, radii):
+            crater_start, crater_end = self._carve_crater(center_x, center_y, radius)
+            x_start = min(x_start, crater_start)
+            x_end = max(x_end, crater_end)
+        
+        self._update_height_map(x_start, x_end)
+    
+    def _carve_crater(self, center_x, center_y, radius, creation_time=None):
+        """Record crater info and remove its terrain pixels, returning the column range touched"""
         center_x = int(center_x)
         center_y = int(center_y)
         
         # Store crater info for merging
-        import time
-        crater_info = {
-            'x': center_x,
-            'y': center_y,
-            'radius': radius,
-            'creation_time': time.time()
-        }
-        self.craters.append(crater_info)
-        
-        # Remove terrain pixels within explosion radius
-        for x in range(max(0, center_x - radius), min(self.width, center_x + radius + 1)):
-            for y in range(max(0, center_y - radius), min(self.height, center_y + radius + 1)):
-                distance = math.sqrt((x - center_x)**2 + (y - center_y)**2)
-                if distance <= radius:
-                    self.terrain_pixels[x][y] = False
-        
-        # Update height map after crater creation
-        self._update_height_map()
-    
-    def _update_height_map(self):
-        """Update height map based on current terrain pixels"""
-        for x in range(self.width):
-            # Find the topmost solid pixel in this column
-            height = self.height
-            for y in range(self.height):
-                if self.terrain_pixels[x][y]:
-                    height = y
-                    break
-            self.height_map[x] = height
+        if creation_time is None:
+            creation_time = time.time()
+        self.craters.append(Crater(center_x, center_y, radius, creation_time))
+        
+        # Remove terrain pixels within explosion radius, one vertical chord (bit run) per column
+        radius_sq = radius * radius
+        x_start = max(0, center_x - radius)
+        x_end = min(self.width, center_x + radius + 1)
+        for x in range(x_start, x_end):
+            half_chord = math.isqrt(radius_sq - (x - center_x)**2)
+            y0 = max(0, center_y - half_chord)
+            y1 = min(self.height, center_y + half_chord + 1)
+            if y0 < y1:
+                self.terrain_pixels[x] &= ~(((1 << (y1 - y0)) - 1) << y0)
+        
+        return x_start, x_end
+    
+    def _update_height_map(self, x_start=0, x_end=None):
+        """Update height map from current terrain pixels for columns x_start..x_end-1"""
+        if x_end is None:
+            x_end = self.width
+        for x in range(x_start, x_end):
+            # Find the topmost solid pixel in this column (lowest set bit)
+            column = self.terrain_pixels[x]
+            self.height_map[x] = (column & -column).bit_length() - 1 if column else self.height
     
     def merge_overlapping_craters(self):
         """Combine craters that overlap to create larger depressions"""
+        # Crater list unchanged since the last merge - the result would be unchanged
+        if self.craters == self._merged_craters:
+            return
+        
         if len(self.craters) < 2:
+            self._merged_craters = self.craters.copy()
             return
         
         # Sort craters by creation order (newer ones have priority)
-        self.craters.sort(key=lambda c: c.get('creation_time', 0))
+        self.craters.sort(key=lambda c: c.creation_time)
+        craters = self.craters
+        
+        # A merged crater can grow into a neighbour, so repeat until nothing overlaps;
+        # this keeps a second merge from changing the result
+        while True:
+            # Struct-of-arrays view of the crater records for the pair scan
+            xs = [c.x for c in craters]
+            ys = [c.y for c in craters]
+            radii = [c.radius for c in craters]
+            
+            # Group crater indices by group id, keeping creation order of each group's oldest crater
+            groups = {}
+            for i, group_id in enumerate(_assign_crater_groups(xs, ys, radii)):
+                groups.setdefault(group_id, []).append(i)
+            
+            if len(groups) == len(craters):
+                break
+            
+            merged = []
+            for group in groups.values():
+                # Fold each group in creation order, newer craters into the merged one
+                merged_crater = craters[group[0]]
+                for i in group[1:]:
+                    merged_crater = self._merge_crater_pair(merged_crater, craters[i])
+                merged.append(merged_crater)
+            # Merged craters take the newest creation time, so restore creation order
+            merged.sort(key=lambda c: c.creation_time)
+            craters = merged
+        
+        self.craters = craters
         
-        merged = []
-        for current_crater in self.craters:
-            merged_with_any = False
-            
-            # Check if this crater overlaps with any in merged list
-            for j, merged_crater in enumerate(merged):
-                distance = math.sqrt((current_crater['x'] - merged_crater['x'])**2 + 
-                                   (current_crater['y'] - merged_crater['y'])**2)
-                
-                # If craters overlap (distance < sum of radii * overlap_factor)
-                overlap_factor = 0.8  # Allow merging when 80% overlap
-                if distance < (current_crater['radius'] + merged_crater['radius']) * overlap_factor:
-                    # Merge craters - weighted average based on size
-                    total_area = current_crater['radius']**2 + merged_crater['radius']**2
-                    weight1 = current_crater['radius']**2 / total_area
-                    weight2 = merged_crater['radius']**2 / total_area
-                    
-                    new_x = int(current_crater['x'] * weight1 + merged_crater['x'] * weight2)
-                    new_y = int(current_crater['y'] * weight1 + merged_crater['y'] * weight2)
-                    
-                    # New radius encompasses both craters with some expansion
-                    max_extent = max(
-                        distance + current_crater['radius'],
-                        distance + merged_crater['radius'],
-                        current_crater['radius'] + merged_crater['radius'] * 0.5
-                    )
-                    new_radius = min(int(max_extent), max(current_crater['radius'], merged_crater['radius']) + 20)
-                    
-                    merged[j] = {
-                        'x': new_x, 
-                        'y': new_y, 
-                        'radius': new_radius,
-                        'creation_time': max(current_crater.get('creation_time', 0), 
-                                           merged_crater.get('creation_time', 0))
-                    }
-                    merged_with_any = True
-                    break
-            
-            if not merged_with_any:
-                merged.append(current_crater)
+        # Limit total number of craters for performance
+        if len(self.craters) > MAX_CRATERS:
+            self.craters = self.craters[-MAX_CRATERS:]
         
-        self.craters = merged
+        self._merged_craters = self.craters.copy()
+    
+    def _merge_crater_pair(self, older_crater, newer_crater):
+        """Merge two overlapping craters - weighted average based on size"""
+        distance = math.sqrt((newer_crater.x - older_crater.x)**2 + 
+                           (newer_crater.y - older_crater.y)**2)
         
-        # Limit total number of craters for performance
-        if len(self.craters) > 50:
-            self.craters = self.craters[-50:]
+        total_area = newer_crater.radius**2 + older_crater.radius**2
+        weight1 = newer_crater.radius**2 / total_area
+        weight2 = older_crater.radius**2 / total_area
+        
+        new_x = int(newer_crater.x * weight1 + older_crater.x * weight2)
+        new_y = int(newer_crater.y * weight1 + older_crater.y * weight2)
+        
+        # New radius encompasses both craters with some expansion
+        max_extent = max(
+            distance + newer_crater.radius,
+            distance + older_crater.radius,
+            newer_crater.radius + older_crater.radius * 0.5
+        )
+        new_radius = min(int(max_extent), max(newer_crater.radius, older_crater.radius) + 20)
+        
+        return Crater(new_x, new_y, new_radius,
+                      max(newer_crater.creation_time, older_crater.creation_time))
 
 class TerrainGenerator:
     """Procedural terrain generation using sine waves for hills and valleys"""
@@ -1511,8 +1671,12 @@ class TerrainGenerator:
     def __init__(self):
         self.base_ground_level = SCREEN_HEIGHT - 100
         
-    def generate_height_map(self, width, complexity=1.0):
+    def generate_height_map(self, width, complexity=1.0, seed=None):
         """Creates varied terrain profile with sand dunes and varied slopes"""
+        if seed is not None:
+            # Reproducible terrain: cached per seed, global random state untouched
+            return list(_seeded_height_map(self.base_ground_level, width, complexity, seed))
+        
         height_map = []
         
         # Multiple sine wave layers for natural-looking terrain
@@ -1535,15 +1699,26 @@ class TerrainGenerator:
         # Dune asymmetry wave - creates realistic dune slopes (steep on one side)
         asymmetry_frequency = 0.004 * complexity
         
+        # Ensure height stays within reasonable bounds
+        min_height = SCREEN_HEIGHT - 220  # Increased range for bigger dunes
+        max_height = SCREEN_HEIGHT - 40   # Allow terrain closer to water
+        
+        # Local bindings for the per-column loop
+        sin = math.sin
+        rand = random.random
+        randint = random.randint
+        base_ground_level = self.base_ground_level
+        append = height_map.append
+        
         for x in range(width):
             # Combine multiple sine waves for natural terrain
-            primary_height = math.sin(x * primary_frequency) * primary_amplitude
-            secondary_height = math.sin(x * secondary_frequency) * secondary_amplitude
-            tertiary_height = math.sin(x * tertiary_frequency) * tertiary_amplitude
-            ripple_height = math.sin(x * ripple_frequency) * ripple_amplitude
+            primary_height = sin(x * primary_frequency) * primary_amplitude
+            secondary_height = sin(x * secondary_frequency) * secondary_amplitude
+            tertiary_height = sin(x * tertiary_frequency) * tertiary_amplitude
+            ripple_height = sin(x * ripple_frequency) * ripple_amplitude
             
             # Add asymmetric dune shaping (creates steeper slopes on one side)
-            asymmetry_factor = math.sin(x * asymmetry_frequency)
+            asymmetry_factor = sin(x * asymmetry_frequency)
             if asymmetry_factor > 0:
                 # Steeper slope on the windward side
                 slope_modifier = asymmetry_factor * 20 * complexity
@@ -1551,55 +1726,40 @@ class TerrainGenerator:
                 secondary_height += slope_modifier * 0.5
             
             # Add some randomness for more natural variation
-            random_variation = (random.random() - 0.5) * 12 * complexity
-            
-            # Create occasional larger dune features
-            if x % 200 == 0:  # Every 200 pixels, chance for a major dune
-                if random.random() < 0.3:  # 30% chance
-                    dune_center = x + random.randint(50, 150)
-                    dune_width = random.randint(80, 120)
-                    dune_height = random.randint(40, 70) * complexity
-                    
-                    # Add dune influence to nearby points
-                    for dx in range(-dune_width//2, dune_width//2):
-                        if 0 <= x + dx < width:
-                            distance_factor = 1 - abs(dx) / (dune_width//2)
-                            if distance_factor > 0:
-                                # Store dune influence for later application
-                                pass
+            random_variation = (rand() - 0.5) * 12 * complexity
+            
+            # Occasional larger dune features (every 200 pixels, 30% chance). Their shape
+            # was never applied to the profile - add_sand_dunes does that - but the draws
+            # are kept so seeded terrain stays the same
+            if x % 200 == 0 and rand() < 0.3:
+                randint(50, 150)
+                randint(80, 120)
+                randint(40, 70)
             
             # Calculate final height
-            total_height = (self.base_ground_level + 
+            total_height = (base_ground_level + 
                           primary_height + 
                           secondary_height + 
                           tertiary_height + 
                           ripple_height +
                           random_variation)
             
-            # Ensure height stays within reasonable bounds
-            min_height = SCREEN_HEIGHT - 220  # Increased range for bigger dunes
-            max_height = SCREEN_HEIGHT - 40   # Allow terrain closer to water
-            total_height = max(min_height, min(max_height, total_height))
-            
-            height_map.append(int(total_height))
+            append(int(max(min_height, min(max_height, total_height))))
         
         return height_map
     
     def smooth_terrain(self, height_map, iterations=3):
         """Applies smoothing to reduce sharp edges"""
         smoothed = height_map.copy()
+        if len(smoothed) < 3:
+            return smoothed  # No interior points to smooth
         
         for _ in range(iterations):
-            new_smoothed = smoothed.copy()
-            
-            # Apply smoothing filter (simple moving average)
-            for i in range(1, len(smoothed) - 1):
-                # Use weighted average with neighbors
-                new_smoothed[i] = int((smoothed[i-1] * 0.25 + 
-                                     smoothed[i] * 0.5 + 
-                                     smoothed[i+1] * 0.25))
-            
-            smoothed = new_smoothed
+            # Apply smoothing filter (simple moving average), endpoints stay fixed
+            # Use weighted average with neighbors, walking three shifted views at once
+            interior = [int(left * 0.25 + mid * 0.5 + right * 0.25)
+                        for left, mid, right in zip(smoothed, smoothed[1:], smoothed[2:])]
+            smoothed = [smoothed[0]] + interior + [smoothed[-1]]
         
         return smoothed
     
@@ -1680,6 +1840,19 @@ class TerrainGenerator:
         
         return smoothed_height_map
 
+@functools.lru_cache(maxsize=64)
+def _seeded_height_map(base_ground_level, width, complexity, seed):
+    """Height map generated from a fixed seed, as an immutable tuple for caching"""
+    generator = TerrainGenerator()
+    generator.base_ground_level = base_ground_level
+    
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        return tuple(generator.generate_height_map(width, complexity))
+    finally:
+        random.setstate(state)
+
 class Terrain:
     def __init__(self, use_varied_terrain=True, terrain_complexity=1.0):
         self.base_ground_level = SCREEN_HEIGHT - 100
@@ -1718,6 +1891,15 @@ class Terrain:
         """Get terrain height using enhanced terrain system"""
         return self.terrain_map.get_ground_height(x)
     
+    def get_ground_heights(self, xs):
+        """Get terrain heights for several x coordinates in one call"""
+        get_ground_height = self.terrain_map.get_ground_height
+        return [get_ground_height(x) for x in xs]
+    
+    def get_all_ground_heights(self):
+        """Get terrain height for every screen column"""
+        return self.get_ground_heights(range(self.terrain_map.width))
+    
     def destroy_tree_at(self, x, y, radius=50):
         """Destroy trees within explosion radius"""
         for tree in self.palm_trees:
@@ -1890,6 +2072,13 @@ class Terrain:
             pygame.draw.line(screen, COLORS['palm_leaves'], (x, frond_y), (end_x, end_y), 4)
 
 class GameManager:
+    # Static controls help shown in the top-right corner
+    _CONTROL_TEXTS = (
+        "WASD: Move/Aim  Space: Jump",
+        "Enter: Charge/Fire  1/2/3: Weapons",
+        "F1: Audio  F2: Effects  F3: Terrain"
+    )
+    
     def __init__(self):
         self.state = "PLAYING"  # "PLAYING", "PROJECTILE_FLYING", "GAME_OVER"
         self.current_player = 0
@@ -1915,6 +2104,22 @@ class GameManager:
         # Initialize audio manager with settings
         self.audio_manager = AudioManager(self.game_settings)
         
+        # UI fonts are created once instead of every frame
+        if not pygame.font.get_init():
+            pygame.font.init()
+        self.font = pygame.font.SysFont(None, 36)
+        self.small_font = pygame.font.SysFont(None, 24)
+        
+        # Controls help never changes, so render it once
+        self._control_blits = [
+            (self.small_font.render(control, True, COLORS['text_slate']), (SCREEN_WIDTH - 300, 10 + i * 25))
+            for i, control in enumerate(self._CONTROL_TEXTS)
+        ]
+        
+        # Settings display is re-rendered only when one of its values changes
+        self._settings_key = None
+        self._settings_blits = []
+        
     def handle_input(self, keys, events):
         if self.state != "PLAYING":
             return
@@ -2052,8 +2257,8 @@ class GameManager:
         self.effects_manager.draw_all_effects(screen)
             
         # Draw UI
-        font = pygame.font.Font(None, 36)
-        small_font = pygame.font.Font(None, 24)
+        font = self.font
+        small_font = self.small_font
         
         if self.state == "GAME_OVER":
             # Game over screen
@@ -2100,29 +2305,35 @@ class GameManager:
                 power_color = (255, int(255 - current_p.power * 2.55), 0)
                 pygame.draw.rect(screen, power_color, (bar_x, bar_y, power_width, bar_height))
         
-        # Controls help
-        controls = [
-            "WASD: Move/Aim  Space: Jump",
-            "Enter: Charge/Fire  1/2/3: Weapons", 
-            "F1: Audio  F2: Effects  F3: Terrain"
-        ]
-        
-        for i, control in enumerate(controls):
-            control_text = small_font.render(control, True, COLORS['text_slate'])
-            screen.blit(control_text, (SCREEN_WIDTH - 300, 10 + i * 25))
+        # Controls help (pre-rendered)
+        screen.blits(self._control_blits, doreturn=0)
         
         # Settings display
-        settings_info = [
-            f"Audio: {'ON' if self.game_settings.is_audio_enabled() else 'OFF'}",
-            f"Effects: {self.game_settings.get_particle_intensity():.1f}x",
-            f"Terrain: {self.game_settings.get_terrain_complexity():.1f}x"
-        ]
+        settings_key = (
+            self.game_settings.is_audio_enabled(),
+            self.game_settings.get_particle_intensity(),
+            self.game_settings.get_terrain_complexity()
+        )
+        if settings_key != self._settings_key:
+            audio_enabled, particle_intensity, terrain_complexity = settings_key
+            settings_info = (
+                f"Audio: {'ON' if audio_enabled else 'OFF'}",
+                f"Effects: {particle_intensity:.1f}x",
+                f"Terrain: {terrain_complexity:.1f}x"
+            )
+            self._settings_blits = [
+                (small_font.render(setting, True, COLORS['text_slate']), (SCREEN_WIDTH - 150, 100 + i * 20))
+                for i, setting in enumerate(settings_info)
+            ]
+            self._settings_key = settings_key
         
-        for i, setting in enumerate(settings_info):
-            setting_text = small_font.render(setting, True, COLORS['text_slate'])
-            screen.blit(setting_text, (SCREEN_WIDTH - 150, 100 + i * 20))
+        screen.blits(self._settings_blits, doreturn=0)
 
 def main():
+    # Initialize Pygame here rather than at import so tests importing this module stay cheap
+    pygame.init()
+    pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+    
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Project Artillery - Sunrise Beach")
     clock = pygame.time.Clock()
@@ -59,8 +59,9 @@ class TestCraterCreation(unittest.TestCase):
             (crater_x, crater_y - 20)       # Above center
         ]
         
+        sqrt = math.sqrt
         for test_x, test_y in test_points:
-            distance = math.sqrt((test_x - crater_x)**2 + (test_y - crater_y)**2)
+            distance = sqrt((test_x - crater_x)**2 + (test_y - crater_y)**2)
             if distance <= crater_radius:
                 self.assertFalse(self.terrain_map.is_solid_at(test_x, test_y),
                                f"Point at distance {distance} should be destroyed")
@@ -81,10 +82,11 @@ class TestCraterCreation(unittest.TestCase):
             (crater_x, crater_y + crater_radius + 20),      # Far below
         ]
         
+        sqrt = math.sqrt
         for test_x, test_y in test_points:
             if (0 <= test_x < SCREEN_WIDTH and 0 <= test_y < SCREEN_HEIGHT and 
                 test_y >= self.ground_level):
-                distance = math.sqrt((test_x - crater_x)**2 + (test_y - crater_y)**2)
+                distance = sqrt((test_x - crater_x)**2 + (test_y - crater_y)**2)
                 if distance > crater_radius + 5:  # Add small buffer for edge cases
                     self.assertTrue(self.terrain_map.is_solid_at(test_x, test_y),
                                    f"Point at distance {distance} should be preserved")
@@ -126,12 +128,16 @@ class TestCraterCreation(unittest.TestCase):
         
         # Test multiple points around the crater
         test_angles = [0, 45, 90, 135, 180, 225, 270, 315]  # 8 directions
+        cos, sin, radians = math.cos, math.sin, math.radians
         
         for angle in test_angles:
+            direction_x = cos(radians(angle))
+            direction_y = sin(radians(angle))
+            
             # Test point just inside radius
             inside_distance = crater_radius * 0.8
-            inside_x = crater_x + math.cos(math.radians(angle)) * inside_distance
-            inside_y = crater_y + math.sin(math.radians(angle)) * inside_distance
+            inside_x = crater_x + direction_x * inside_distance
+            inside_y = crater_y + direction_y * inside_distance
             
             if (0 <= inside_x < SCREEN_WIDTH and 0 <= inside_y < SCREEN_HEIGHT):
                 self.assertFalse(terrain_map.is_solid_at(int(inside_x), int(inside_y)),
@@ -139,8 +145,8 @@ class TestCraterCreation(unittest.TestCase):
             
             # Test point just outside radius
             outside_distance = crater_radius * 1.2
-            outside_x = crater_x + math.cos(math.radians(angle)) * outside_distance
-            outside_y = crater_y + math.sin(math.radians(angle)) * outside_distance
+            outside_x = crater_x + direction_x * outside_distance
+            outside_y = crater_y + direction_y * outside_distance
             
             if (0 <= outside_x < SCREEN_WIDTH and 0 <= outside_y < SCREEN_HEIGHT and
                 outside_y >= self.ground_level):
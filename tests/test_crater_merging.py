@@ -8,20 +8,27 @@ Property-based tests for crater merging behavior
 import unittest
 import sys
 import os
-import math
-import time
+import copy
+import random
 
 # Add the parent directory to the path so we can import main
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
-    from hypothesis import given, strategies as st, settings
+    from hypothesis import given, strategies as st, settings, assume, Phase
+    # Shared profile: no example database I/O, no shrink/replay phases on green
+    # runs, and a fixed seed so any failure reproduces without a stored example
+    settings.register_profile("ci", max_examples=30, deadline=None, database=None,
+                              derandomize=True, phases=[Phase.generate, Phase.target])
     HYPOTHESIS_AVAILABLE = True
 except ImportError:
     HYPOTHESIS_AVAILABLE = False
     print("Warning: Hypothesis not available. Install with: pip install hypothesis")
 
-from main import TerrainMap, SCREEN_WIDTH, SCREEN_HEIGHT
+from main import TerrainMap, Crater, SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Terrain maps returned by finished tests, reset and reused by the next one
+_terrain_pool = []
 
 class TestCraterMerging(unittest.TestCase):
     """
@@ -30,10 +37,36 @@ class TestCraterMerging(unittest.TestCase):
     to create larger, more realistic depressions rather than separate holes
     """
     
+    @classmethod
+    def setUpClass(cls):
+        """Build one template terrain map shared by every test"""
+        cls.ground_level = 500
+        cls._template = TerrainMap(SCREEN_WIDTH, SCREEN_HEIGHT, cls.ground_level)
+    
     def setUp(self):
         """Set up test fixtures"""
-        self.ground_level = 500
-        self.terrain_map = TerrainMap(SCREEN_WIDTH, SCREEN_HEIGHT, self.ground_level)
+        self.terrain_map = self._acquire_terrain_map()
+    
+    def tearDown(self):
+        """Return the terrain map to the pool"""
+        _terrain_pool.append(self.terrain_map)
+    
+    def _acquire_terrain_map(self):
+        """Take a pooled terrain map reset to the template, or copy the template"""
+        if not _terrain_pool:
+            terrain_map = copy.copy(self._template)
+            terrain_map.height_map = self._template.height_map.copy()
+            terrain_map.terrain_pixels = self._template.terrain_pixels.copy()
+            terrain_map.craters = []
+            return terrain_map
+        
+        terrain_map = _terrain_pool.pop()
+        terrain_map.reset()  # In place, so no new columns are allocated
+        return terrain_map
+    
+    def _overlap_message(self, dist_sq, overlap_threshold, expectation):
+        """Failure message; the actual distance is only needed for reporting"""
+        return f"Craters at distance {dist_sq ** 0.5} with threshold {overlap_threshold} {expectation}"
     
     def test_overlapping_craters_merge(self):
         """Test that overlapping craters merge into larger depressions"""
@@ -42,9 +75,9 @@ class TestCraterMerging(unittest.TestCase):
         crater2_x, crater2_y, crater2_radius = 330, 525, 35
         
         # Verify they overlap
-        distance = math.sqrt((crater2_x - crater1_x)**2 + (crater2_y - crater1_y)**2)
+        dx, dy = crater2_x - crater1_x, crater2_y - crater1_y
         overlap_threshold = (crater1_radius + crater2_radius) * 0.8
-        self.assertLess(distance, overlap_threshold, "Craters should overlap for this test")
+        self.assertLess(dx * dx + dy * dy, overlap_threshold ** 2, "Craters should overlap for this test")
         
         # Create first crater
         self.terrain_map.create_crater(crater1_x, crater1_y, crater1_radius)
@@ -68,9 +101,9 @@ class TestCraterMerging(unittest.TestCase):
         crater2_x, crater2_y, crater2_radius = 400, 530, 35
         
         # Verify they don't overlap
-        distance = math.sqrt((crater2_x - crater1_x)**2 + (crater2_y - crater1_y)**2)
+        dx, dy = crater2_x - crater1_x, crater2_y - crater1_y
         overlap_threshold = (crater1_radius + crater2_radius) * 0.8
-        self.assertGreater(distance, overlap_threshold, "Craters should not overlap for this test")
+        self.assertGreater(dx * dx + dy * dy, overlap_threshold ** 2, "Craters should not overlap for this test")
         
         # Create both craters
         self.terrain_map.create_crater(crater1_x, crater1_y, crater1_radius)
@@ -92,10 +125,9 @@ class TestCraterMerging(unittest.TestCase):
         crater1_x, crater1_y, crater1_radius = 350, 520, 40
         crater2_x, crater2_y, crater2_radius = 370, 530, 30
         
-        # Create craters with slight delay to test creation time handling
-        self.terrain_map.create_crater(crater1_x, crater1_y, crater1_radius)
-        time.sleep(0.01)  # Small delay
-        self.terrain_map.create_crater(crater2_x, crater2_y, crater2_radius)
+        # Create craters with distinct creation times to test creation time handling
+        self.terrain_map.create_crater(crater1_x, crater1_y, crater1_radius, creation_time=1.0)
+        self.terrain_map.create_crater(crater2_x, crater2_y, crater2_radius, creation_time=2.0)
         
         # Merge craters
         self.terrain_map.merge_overlapping_craters()
@@ -105,16 +137,34 @@ class TestCraterMerging(unittest.TestCase):
         
         merged_crater = self.terrain_map.craters[0]
         
-        # Merged crater position should be between original positions
-        self.assertGreater(merged_crater['x'], min(crater1_x, crater2_x))
-        self.assertLess(merged_crater['x'], max(crater1_x, crater2_x))
-        
-        # Merged crater should be larger than individual craters
-        self.assertGreater(merged_crater['radius'], max(crater1_radius, crater2_radius))
+        # Merged crater position should be between original positions and
+        # merged crater should be larger than individual craters
+        self.assertTrue(
+            min(crater1_x, crater2_x) < merged_crater['x'] < max(crater1_x, crater2_x)
+            and merged_crater['radius'] > max(crater1_radius, crater2_radius),
+            msg=f"Unexpected merged crater {merged_crater}")
         
         # Should have creation time
         self.assertIn('creation_time', merged_crater)
     
+    def test_merged_crater_radius_rule(self):
+        """Test that a merged crater spans both craters but grows at most 20px past the larger one"""
+        # Two equal craters 20px apart: the span (20 + 30) and the cap (30 + 20) agree
+        self.terrain_map.create_crater(300, 520, 30)
+        self.terrain_map.create_crater(320, 520, 30)
+        self.terrain_map.merge_overlapping_craters()
+        self.assertEqual(len(self.terrain_map.craters), 1)
+        self.assertEqual(self.terrain_map.craters[0]['radius'], 50)
+        self.assertEqual(self.terrain_map.craters[0]['x'], 310)
+        
+        # Craters 40px apart would span 80px, but growth is capped at the larger radius + 20
+        self.terrain_map.reset()
+        self.terrain_map.create_crater(300, 520, 40)
+        self.terrain_map.create_crater(340, 520, 40)
+        self.terrain_map.merge_overlapping_craters()
+        self.assertEqual(len(self.terrain_map.craters), 1)
+        self.assertEqual(self.terrain_map.craters[0]['radius'], 60)
+    
     def test_multiple_crater_chain_merging(self):
         """Test merging of multiple craters in a chain"""
         # Create a chain of overlapping craters
@@ -125,9 +175,9 @@ class TestCraterMerging(unittest.TestCase):
             (375, 535, 28)
         ]
         
-        # Create all craters
-        for crater_x, crater_y, crater_radius in craters:
-            self.terrain_map.create_crater(crater_x, crater_y, crater_radius)
+        # Create all craters in one batch
+        crater_xs, crater_ys, crater_radii = zip(*craters)
+        self.terrain_map.create_craters_bulk(crater_xs, crater_ys, crater_radii)
         
         initial_count = len(self.terrain_map.craters)
         
@@ -145,8 +195,7 @@ class TestCraterMerging(unittest.TestCase):
             merged_crater = self.terrain_map.craters[0]  # Assuming one large merged crater
             
             # Check that merged crater covers the general area
-            leftmost_x = min(crater[0] for crater in craters)
-            rightmost_x = max(crater[0] for crater in craters)
+            leftmost_x, rightmost_x = min(crater_xs), max(crater_xs)
             
             # Merged crater should be positioned within the chain area
             self.assertGreaterEqual(merged_crater['x'] + merged_crater['radius'], leftmost_x)
@@ -161,63 +210,64 @@ class TestCraterMerging(unittest.TestCase):
         offset_x=st.integers(min_value=-50, max_value=50),
         offset_y=st.integers(min_value=-30, max_value=30)
     )
-    @settings(max_examples=30, deadline=None)
+    @settings(settings.get_profile("ci"))
     def test_property_crater_merging_consistency(self, crater1_x, crater1_y, crater1_radius, 
                                                crater2_radius, offset_x, offset_y):
         """
         Property test: Crater merging should be consistent and predictable
         """
-        # Create fresh terrain for each test
-        terrain_map = TerrainMap(SCREEN_WIDTH, SCREEN_HEIGHT, self.ground_level)
-        
         # Calculate second crater position
         crater2_x = crater1_x + offset_x
         crater2_y = crater1_y + offset_y
         
-        # Ensure second crater is within bounds
-        if not (50 <= crater2_x <= SCREEN_WIDTH - 50 and 500 <= crater2_y <= 600):
-            return  # Skip invalid configurations
-        
-        # Create both craters
-        terrain_map.create_crater(crater1_x, crater1_y, crater1_radius)
-        terrain_map.create_crater(crater2_x, crater2_y, crater2_radius)
-        
-        initial_count = len(terrain_map.craters)
+        # Ensure second crater is within bounds (rejected examples are regenerated)
+        assume(50 <= crater2_x <= SCREEN_WIDTH - 50 and 500 <= crater2_y <= 600)
         
-        # Calculate if craters should overlap
-        distance = math.sqrt(offset_x**2 + offset_y**2)
-        overlap_threshold = (crater1_radius + crater2_radius) * 0.8
-        should_merge = distance < overlap_threshold
-        
-        # Merge craters
-        terrain_map.merge_overlapping_craters()
-        
-        final_count = len(terrain_map.craters)
-        
-        if should_merge:
-            # Should have merged (fewer craters)
-            self.assertLess(final_count, initial_count,
-                           f"Craters at distance {distance} with threshold {overlap_threshold} should merge")
+        # Create fresh terrain for each test
+        terrain_map = self._acquire_terrain_map()
+        try:
+            # Create both craters
+            terrain_map.create_crater(crater1_x, crater1_y, crater1_radius)
+            terrain_map.create_crater(crater2_x, crater2_y, crater2_radius)
+            
+            initial_count = len(terrain_map.craters)
             
-            # Merged crater should exist and be reasonable
-            if final_count > 0:
-                merged_crater = terrain_map.craters[0]
-                self.assertGreater(merged_crater['radius'], 0, "Merged crater should have positive radius")
-                self.assertLess(merged_crater['radius'], 200, "Merged crater should not be unreasonably large")
-        else:
-            # Should not have merged (same count)
-            self.assertEqual(final_count, initial_count,
-                           f"Craters at distance {distance} with threshold {overlap_threshold} should not merge")
+            # Calculate if craters should overlap
+            dist_sq = offset_x * offset_x + offset_y * offset_y
+            overlap_threshold = (crater1_radius + crater2_radius) * 0.8
+            should_merge = dist_sq < overlap_threshold ** 2
+            
+            # Merge craters
+            terrain_map.merge_overlapping_craters()
+            
+            final_count = len(terrain_map.craters)
+            
+            if should_merge:
+                # Should have merged (fewer craters)
+                self.assertLess(final_count, initial_count,
+                               self._overlap_message(dist_sq, overlap_threshold, "should merge"))
+                
+                # Merged crater should exist and be reasonable
+                if final_count > 0:
+                    merged_crater = terrain_map.craters[0]
+                    self.assertTrue(0 < merged_crater['radius'] < 200,
+                                   "Merged crater should have a positive, not unreasonably large radius")
+            else:
+                # Should not have merged (same count)
+                self.assertEqual(final_count, initial_count,
+                               self._overlap_message(dist_sq, overlap_threshold, "should not merge"))
+        finally:
+            _terrain_pool.append(terrain_map)
     
     def test_crater_merging_performance_limit(self):
         """Test that crater merging limits total crater count for performance"""
         # Create many craters to test performance limiting
-        for i in range(60):  # More than the 50 crater limit
-            crater_x = 200 + (i * 10) % 400  # Spread across terrain
-            crater_y = 520 + (i % 5) * 5     # Slight y variation
-            crater_radius = 20 + (i % 10)    # Varying sizes
-            
-            self.terrain_map.create_crater(crater_x, crater_y, crater_radius)
+        crater_count = 60  # More than the 50 crater limit
+        crater_xs = [200 + (i * 10) % 400 for i in range(crater_count)]  # Spread across terrain
+        crater_ys = [520 + (i % 5) * 5 for i in range(crater_count)]     # Slight y variation
+        crater_radii = [20 + (i % 10) for i in range(crater_count)]      # Varying sizes
+        
+        self.terrain_map.create_craters_bulk(crater_xs, crater_ys, crater_radii)
         
         # Merge craters
         self.terrain_map.merge_overlapping_craters()
@@ -233,9 +283,9 @@ class TestCraterMerging(unittest.TestCase):
         large_crater_x, large_crater_y, large_radius = 320, 525, 60
         
         # Position them to overlap
-        distance = math.sqrt((large_crater_x - small_crater_x)**2 + (large_crater_y - small_crater_y)**2)
+        dx, dy = large_crater_x - small_crater_x, large_crater_y - small_crater_y
         overlap_threshold = (small_radius + large_radius) * 0.8
-        self.assertLess(distance, overlap_threshold, "Craters should overlap")
+        self.assertLess(dx * dx + dy * dy, overlap_threshold ** 2, "Craters should overlap")
         
         # Create craters
         self.terrain_map.create_crater(small_crater_x, small_crater_y, small_radius)
@@ -258,29 +308,53 @@ class TestCraterMerging(unittest.TestCase):
                            "Merged crater should be closer to larger crater due to weighted average")
     
     def test_crater_merging_idempotent(self):
-        """Test that crater merging is idempotent (multiple calls don't change result)"""
-        # Create overlapping craters
+        """Test that crater merging is idempotent (a real second merge doesn't change the result)"""
+        # Overlapping pair plus seeded crowded layouts where merged craters grow into neighbours
+        layouts = [[(300, 520, 40), (320, 525, 35)]]
+        for seed in range(5):
+            rng = random.Random(seed)
+            layouts.append([(rng.randint(50, SCREEN_WIDTH - 50), rng.randint(500, 600), rng.randint(10, 60))
+                            for _ in range(30)])
+        
+        for index, layout in enumerate(layouts):
+            with self.subTest(layout=index):
+                self.terrain_map.reset()
+                for creation_time, (crater_x, crater_y, crater_radius) in enumerate(layout):
+                    self.terrain_map.create_crater(crater_x, crater_y, crater_radius, creation_time=creation_time)
+                
+                # Merge once
+                self.terrain_map.merge_overlapping_craters()
+                first_merge = [(c.x, c.y, c.radius) for c in self.terrain_map.craters]
+                
+                # Hand back fresh crater records so the second call runs a full merge pass
+                self.terrain_map.craters = [crater.copy() for crater in self.terrain_map.craters]
+                self.terrain_map.merge_overlapping_craters()
+                second_merge = [(c.x, c.y, c.radius) for c in self.terrain_map.craters]
+                
+                self.assertEqual(second_merge, first_merge,
+                                "Multiple merge calls should not change result")
+    
+    def test_crater_merging_picks_up_direct_list_changes(self):
+        """Test that craters appended to or reassigned on the public list are merged"""
         self.terrain_map.create_crater(300, 520, 40)
-        self.terrain_map.create_crater(320, 525, 35)
-        
-        # Merge once
         self.terrain_map.merge_overlapping_craters()
-        first_merge_count = len(self.terrain_map.craters)
-        first_merge_crater = self.terrain_map.craters[0].copy() if first_merge_count > 0 else None
         
-        # Merge again
+        # A merge with nothing new leaves the crater list untouched
+        crater_list = self.terrain_map.craters
         self.terrain_map.merge_overlapping_craters()
-        second_merge_count = len(self.terrain_map.craters)
+        self.assertIs(self.terrain_map.craters, crater_list)
         
-        # Should be the same
-        self.assertEqual(second_merge_count, first_merge_count,
-                        "Multiple merge calls should not change result")
+        # An overlapping record appended directly, bypassing create_crater, still merges
+        self.terrain_map.craters.append(Crater(320, 525, 35, creation_time=1))
+        self.terrain_map.merge_overlapping_craters()
+        self.assertEqual(len(self.terrain_map.craters), 1,
+                        "Crater appended to the list should be merged")
         
-        if first_merge_crater and second_merge_count > 0:
-            second_merge_crater = self.terrain_map.craters[0]
-            self.assertEqual(first_merge_crater['x'], second_merge_crater['x'])
-            self.assertEqual(first_merge_crater['y'], second_merge_crater['y'])
-            self.assertEqual(first_merge_crater['radius'], second_merge_crater['radius'])
+        # So does a reassigned list of overlapping records
+        self.terrain_map.craters = [Crater(300, 520, 40, creation_time=0), Crater(330, 525, 35, creation_time=1)]
+        self.terrain_map.merge_overlapping_craters()
+        self.assertEqual(len(self.terrain_map.craters), 1,
+                        "Reassigned crater list should be merged")
 
 if __name__ == '__main__':
     # Run the tests
@@ -9,6 +9,7 @@ import unittest
 import sys
 import os
 import math
+from typing import NamedTuple
 
 # Add the parent directory to the path so we can import main
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -22,36 +23,51 @@ except ImportError:
 
 from main import Player, Terrain, Projectile, TerrainMap, SCREEN_WIDTH, SCREEN_HEIGHT
 
-class MockTerrain:
-    """Mock terrain with controllable slopes for testing"""
-    def __init__(self, slope_angle=0):
-        self.slope_angle = slope_angle  # Degrees
-        self.ground_level = 500
-        self.palm_trees = []
-        self.terrain_map = MockTerrainMap(slope_angle)
-    
-    def get_ground_height(self, x):
-        # Create sloped ground based on angle
-        slope_radians = math.radians(self.slope_angle)
-        height_change = x * math.tan(slope_radians)
-        return self.ground_level + height_change
+# tan() of every whole-degree slope, indexed by degree + 90
+_TAN_DEG_LUT = [math.tan(math.radians(d)) for d in range(-90, 91)]
 
-class MockTerrainMap:
+def _tan_deg(slope_angle):
+    """Tangent of a slope in degrees, from the lookup table for whole degrees"""
+    if float(slope_angle).is_integer() and -90 < slope_angle < 90:
+        return _TAN_DEG_LUT[int(slope_angle) + 90]
+    return math.tan(math.radians(slope_angle))
+
+class MockTerrainMap(NamedTuple):
     """Mock terrain map with slope support"""
-    def __init__(self, slope_angle=0):
-        self.slope_angle = slope_angle
-        self.ground_level = 500
-        self.height = SCREEN_HEIGHT
-        self.width = SCREEN_WIDTH
+    ground_level: float
+    tan_slope: float
+    height: int = SCREEN_HEIGHT
+    width: int = SCREEN_WIDTH
     
     def get_accurate_ground_height(self, x, y_start=None):
-        slope_radians = math.radians(self.slope_angle)
-        height_change = x * math.tan(slope_radians)
-        return self.ground_level + height_change
+        return self.ground_level + x * self.tan_slope
     
     def is_solid_at(self, x, y):
-        ground_height = self.get_accurate_ground_height(x)
-        return y >= ground_height
+        return y >= self.ground_level + x * self.tan_slope
+
+class _MockTerrainRecord(NamedTuple):
+    slope_angle: float  # Degrees
+    ground_level: float
+    tan_slope: float
+    terrain_map: MockTerrainMap
+    palm_trees: tuple = ()
+
+class MockTerrain(_MockTerrainRecord):
+    """Mock terrain with controllable slopes for testing, as an immutable record"""
+    __slots__ = ()
+    
+    def __new__(cls, slope_angle=0):
+        tan_slope = _tan_deg(slope_angle)
+        return super().__new__(cls, slope_angle, 500, tan_slope, MockTerrainMap(500, tan_slope))
+    
+    def get_ground_height(self, x):
+        # Create sloped ground based on angle
+        return self.ground_level + x * self.tan_slope
+
+def _place_on_ground(player, terrain):
+    """Stand the player on the ground directly below its x position"""
+    player.y = terrain.get_ground_height(player.x) - player.height
+    player.on_ground = True
 
 class TestSlopedTerrainPhysics(unittest.TestCase):
     """
@@ -60,11 +76,12 @@ class TestSlopedTerrainPhysics(unittest.TestCase):
     with appropriate effects on movement speed and collision detection
     """
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.flat_terrain = MockTerrain(slope_angle=0)
-        self.uphill_terrain = MockTerrain(slope_angle=15)    # 15 degree upward slope
-        self.downhill_terrain = MockTerrain(slope_angle=-15) # 15 degree downward slope
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared terrains; no test mutates them"""
+        cls.flat_terrain = MockTerrain(slope_angle=0)
+        cls.uphill_terrain = MockTerrain(slope_angle=15)    # 15 degree upward slope
+        cls.downhill_terrain = MockTerrain(slope_angle=-15) # 15 degree downward slope
     
     def test_player_movement_on_flat_terrain(self):
         """Test that player movement works normally on flat terrain"""
@@ -89,9 +106,8 @@ class TestSlopedTerrainPhysics(unittest.TestCase):
         # Test uphill movement (should be slower)
         uphill_player = Player(100, 400, 0)
         uphill_player.x = 100
-        uphill_player.y = self.uphill_terrain.get_ground_height(100) - uphill_player.height
         uphill_player.velocity_x = 5  # Moving right (uphill)
-        uphill_player.on_ground = True
+        _place_on_ground(uphill_player, self.uphill_terrain)
         
         # Update on uphill terrain
         uphill_player.update(self.uphill_terrain)
@@ -100,9 +116,8 @@ class TestSlopedTerrainPhysics(unittest.TestCase):
         # Test downhill movement (should be faster or maintain speed better)
         downhill_player = Player(100, 400, 0)
         downhill_player.x = 100
-        downhill_player.y = self.downhill_terrain.get_ground_height(100) - downhill_player.height
         downhill_player.velocity_x = 5  # Moving right (downhill)
-        downhill_player.on_ground = True
+        _place_on_ground(downhill_player, self.downhill_terrain)
         
         # Update on downhill terrain
         downhill_player.update(self.downhill_terrain)
@@ -176,12 +191,13 @@ class TestSlopedTerrainPhysics(unittest.TestCase):
         height1 = slope_terrain.get_ground_height(x1)
         height2 = slope_terrain.get_ground_height(x2)
         
-        # Calculate slope angle
-        height_diff = height2 - height1
-        horizontal_diff = x2 - x1
-        calculated_angle = math.degrees(math.atan2(height_diff, horizontal_diff))
+        # Height change should follow the cached slope tangent exactly
+        self.assertTrue(math.isclose(height2 - height1, (x2 - x1) * slope_terrain.terrain_map.tan_slope,
+                                     rel_tol=1e-9),
+                        "Height change should match known slope")
         
-        # Should match the known slope (within tolerance)
+        # Recovering the angle itself (documents the degree convention)
+        calculated_angle = math.degrees(math.atan2(height2 - height1, x2 - x1))
         self.assertAlmostEqual(calculated_angle, known_slope, places=1,
                               msg="Calculated slope angle should match known slope")
     
@@ -255,26 +271,35 @@ class TestSlopedTerrainPhysics(unittest.TestCase):
         start_y = 200  # Well above ground
         projectile = Projectile(start_x, start_y, projectile_velocity_x, projectile_velocity_y, "rocket", 50)
         
-        # Simulate projectile flight
+        # Simulate projectile flight (simplified physics: x += vx; y += vy; vy += 0.5).
+        # After k steps x = x0 + vx*k and y = y0 + vy*k + 0.25*k*(k-1); on a straight
+        # slope the height above ground is quadratic in k, so solve for the hit step
         max_iterations = 200
-        hit_ground = False
-        
-        for _ in range(max_iterations):
-            # Check if projectile would hit ground
-            ground_height = terrain.get_ground_height(projectile.x)
-            if projectile.y >= ground_height:
-                hit_ground = True
-                break
-            
-            # Update projectile position manually (simplified physics)
-            projectile.x += projectile.velocity_x
-            projectile.y += projectile.velocity_y
-            projectile.velocity_y += 0.5  # Gravity
-            
-            # Check bounds
-            if (projectile.x < 0 or projectile.x > SCREEN_WIDTH or 
-                projectile.y > SCREEN_HEIGHT + 100):
-                break
+        tan_slope = terrain.terrain_map.tan_slope
+        
+        def position(k):
+            return (start_x + projectile_velocity_x * k,
+                    start_y + projectile_velocity_y * k + 0.25 * k * (k - 1))
+        
+        def below_ground(k):
+            x, y = position(k)
+            return y >= terrain.get_ground_height(x)
+        
+        a = 0.25
+        b = projectile_velocity_y - 0.25 - projectile_velocity_x * tan_slope
+        c = start_y - terrain.ground_level - start_x * tan_slope  # < 0: starts above ground
+        hit_step = max(0, math.ceil((-b + math.sqrt(b * b - 4 * a * c)) / (2 * a)))
+        # Settle float rounding in the root onto the exact first step below ground
+        while hit_step > 0 and below_ground(hit_step - 1):
+            hit_step -= 1
+        while not below_ground(hit_step):
+            hit_step += 1
+        
+        # x only grows and y is convex in k, so bounds need checking at the hit step alone
+        projectile.x, projectile.y = position(hit_step)
+        hit_ground = (hit_step < max_iterations and
+                      projectile.x <= SCREEN_WIDTH and
+                      projectile.y <= SCREEN_HEIGHT + 100)
         
         # If projectile hit ground, verify it's at correct height
         if hit_ground:
@@ -289,9 +314,8 @@ class TestSlopedTerrainPhysics(unittest.TestCase):
         
         player = Player(100, 400, 0)
         player.x = 100
-        player.y = steep_terrain.get_ground_height(100) - player.height
         player.velocity_x = 3  # Moderate velocity
-        player.on_ground = True
+        _place_on_ground(player, steep_terrain)
         
         # Update player on steep terrain
         initial_x = player.x
@@ -314,9 +338,8 @@ class TestSlopedTerrainPhysics(unittest.TestCase):
         
         # Update on moderate slope
         player.x = 200
-        player.y = moderate_slope.get_ground_height(200) - player.height
         player.velocity_x = 5
-        player.on_ground = True
+        _place_on_ground(player, moderate_slope)
         player.update(moderate_slope)
         
         moderate_velocity = player.velocity_x
@@ -342,28 +365,28 @@ class TestSlopedTerrainPhysics(unittest.TestCase):
         # Test accessibility at multiple points across the terrain
         test_positions = [100, 300, 500, 700, 900, 1100]
         
-        for x_pos in test_positions:
-            # Position player at this location
-            ground_height = terrain.get_ground_height(x_pos)
-            player.x = x_pos
-            player.y = ground_height - player.height - 10  # Start slightly above
-            player.velocity_y = 5  # Falling
-            player.on_ground = False
-            
-            # Let player fall and settle
-            for _ in range(20):
-                player.update(terrain)
-                if player.on_ground:
-                    break
-            
-            # Player should be able to land and be stable
-            self.assertTrue(player.on_ground, f"Player should be able to land at x={x_pos}")
-            
-            # Player should be positioned reasonably
-            expected_ground = terrain.get_ground_height(player.x + player.width // 2)
-            player_bottom = player.y + player.height
-            self.assertLessEqual(abs(player_bottom - expected_ground), 10,
-                               f"Player should be positioned correctly at x={x_pos}")
+        # Starting heights for every position in one batched lookup
+        start_grounds = terrain.get_ground_heights(test_positions)
+        
+        for x_pos, ground_height in zip(test_positions, start_grounds):
+            with self.subTest(x=x_pos):
+                # Position player slightly above this location, falling
+                player.reset(x_pos, ground_height - player.height - 10, velocity_y=5)
+                
+                # Let player fall and settle
+                for _ in range(20):
+                    player.update(terrain)
+                    if player.on_ground:
+                        break
+                
+                # Player should be able to land and be stable
+                self.assertTrue(player.on_ground, f"Player should be able to land at x={x_pos}")
+                
+                # Player should be positioned reasonably
+                expected_ground = terrain.get_ground_height(player.x + player.width // 2)
+                player_bottom = player.y + player.height
+                self.assertLessEqual(abs(player_bottom - expected_ground), 10,
+                                   f"Player should be positioned correctly at x={x_pos}")
 
 if __name__ == '__main__':
     # Run the tests
@@ -8,14 +8,14 @@ Property-based tests for modified terrain collision accuracy
 import unittest
 import sys
 import os
-import math
 import random
 
 # Add the parent directory to the path so we can import main
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
-    from hypothesis import given, strategies as st, settings
+    from hypothesis import strategies as st, settings
+    from hypothesis.stateful import RuleBasedStateMachine, initialize, invariant, rule
     HYPOTHESIS_AVAILABLE = True
 except ImportError:
     HYPOTHESIS_AVAILABLE = False
@@ -30,10 +30,16 @@ class TestModifiedTerrainCollision(unittest.TestCase):
     and ground height calculations should remain accurate
     """
     
+    @classmethod
+    def setUpClass(cls):
+        """Build one terrain map shared by every test"""
+        cls.ground_level = 500
+        cls._shared_terrain = TerrainMap(SCREEN_WIDTH, SCREEN_HEIGHT, cls.ground_level)
+    
     def setUp(self):
         """Set up test fixtures"""
-        self.ground_level = 500
-        self.terrain_map = TerrainMap(SCREEN_WIDTH, SCREEN_HEIGHT, self.ground_level)
+        self.terrain_map = self._shared_terrain
+        self.terrain_map.reset()
     
     def test_ground_height_accuracy_after_crater_creation(self):
         """Test that ground height calculations remain accurate after crater creation"""
@@ -123,83 +129,6 @@ class TestModifiedTerrainCollision(unittest.TestCase):
         self.assertGreater(player.y + player.height, self.ground_level,
                           "Player should be deeper than original ground level when in crater")
     
-    @unittest.skipUnless(HYPOTHESIS_AVAILABLE, "Hypothesis not available")
-    @given(
-        crater_x=st.integers(min_value=50, max_value=SCREEN_WIDTH-50),
-        crater_y=st.integers(min_value=500, max_value=600),  # At or below ground level
-        crater_radius=st.integers(min_value=20, max_value=80),
-        test_x=st.integers(min_value=0, max_value=SCREEN_WIDTH-1)
-    )
-    @settings(max_examples=50, deadline=None)
-    def test_property_ground_height_consistency(self, crater_x, crater_y, crater_radius, test_x):
-        """
-        Property test: Ground height calculations should be consistent and accurate
-        for any crater configuration and test position
-        """
-        # Create fresh terrain for each test
-        terrain_map = TerrainMap(SCREEN_WIDTH, SCREEN_HEIGHT, self.ground_level)
-        
-        # Create crater
-        terrain_map.create_crater(crater_x, crater_y, crater_radius)
-        
-        # Get ground height at test position
-        ground_height = terrain_map.get_ground_height(test_x)
-        
-        # Ground height should be valid (within screen bounds)
-        self.assertGreaterEqual(ground_height, 0, "Ground height should be non-negative")
-        self.assertLessEqual(ground_height, SCREEN_HEIGHT, "Ground height should be within screen")
-        
-        # Ground height should be consistent with pixel-level collision detection
-        # Check if there's solid terrain at the reported ground height
-        if ground_height < SCREEN_HEIGHT:
-            # There should be solid terrain at or just below the reported height
-            found_solid = False
-            for check_y in range(int(ground_height), min(SCREEN_HEIGHT, int(ground_height) + 10)):
-                if terrain_map.is_solid_at(test_x, check_y):
-                    found_solid = True
-                    break
-            
-            # If we're not in a deep crater, we should find solid terrain
-            distance_to_crater = math.sqrt((test_x - crater_x)**2 + (ground_height - crater_y)**2)
-            if distance_to_crater > crater_radius:
-                self.assertTrue(found_solid, 
-                               f"Should find solid terrain near reported ground height at x={test_x}")
-    
-    @unittest.skipUnless(HYPOTHESIS_AVAILABLE, "Hypothesis not available")
-    @given(
-        crater_x=st.integers(min_value=50, max_value=SCREEN_WIDTH-50),
-        crater_y=st.integers(min_value=500, max_value=600),  # At or below ground level
-        crater_radius=st.integers(min_value=20, max_value=80),
-        projectile_x=st.integers(min_value=0, max_value=SCREEN_WIDTH-1),
-        projectile_y=st.integers(min_value=0, max_value=SCREEN_HEIGHT-1)
-    )
-    @settings(max_examples=50, deadline=None)
-    def test_property_projectile_collision_accuracy(self, crater_x, crater_y, crater_radius, 
-                                                   projectile_x, projectile_y):
-        """
-        Property test: Projectile collision detection should be accurate on modified terrain
-        """
-        # Create fresh terrain for each test
-        terrain_map = TerrainMap(SCREEN_WIDTH, SCREEN_HEIGHT, self.ground_level)
-        
-        # Create crater
-        terrain_map.create_crater(crater_x, crater_y, crater_radius)
-        
-        # Test collision detection at projectile position
-        is_solid = terrain_map.is_solid_at(projectile_x, projectile_y)
-        ground_height = terrain_map.get_ground_height(projectile_x)
-        
-        # If projectile is above ground height, it should not be in solid terrain
-        if projectile_y < ground_height:
-            self.assertFalse(is_solid, 
-                           f"Position above ground height should not be solid at ({projectile_x}, {projectile_y})")
-        
-        # If projectile is well below original ground level and outside crater, should be solid
-        distance_to_crater = math.sqrt((projectile_x - crater_x)**2 + (projectile_y - crater_y)**2)
-        if (projectile_y > self.ground_level + 20 and distance_to_crater > crater_radius + 10):
-            self.assertTrue(is_solid,
-                          f"Position well below ground and outside crater should be solid at ({projectile_x}, {projectile_y})")
-    
     def test_multiple_craters_collision_accuracy(self):
         """Test collision accuracy with multiple overlapping craters"""
         # Create multiple craters at ground level
@@ -249,6 +178,91 @@ class TestModifiedTerrainCollision(unittest.TestCase):
         self.assertFalse(self.terrain_map.is_solid_at(inside_x, inside_y),
                         "Position inside crater should not be solid")
 
+if HYPOTHESIS_AVAILABLE:
+    class CraterMachine(RuleBasedStateMachine):
+        """
+        Stateful property test: collision queries stay accurate while craters
+        accumulate on one terrain map that is reset rather than rebuilt
+        """
+        
+        ground_level = 500
+        max_craters = 8
+        _shared_terrain = None
+        
+        @initialize()
+        def setup_terrain(self):
+            """Reuse the class terrain map, restored to its original state"""
+            if CraterMachine._shared_terrain is None:
+                CraterMachine._shared_terrain = TerrainMap(SCREEN_WIDTH, SCREEN_HEIGHT, self.ground_level)
+            self.terrain_map = CraterMachine._shared_terrain
+            self.terrain_map.reset()
+            self.craters = []
+        
+        def inside_any_crater(self, x, y, margin=0):
+            """Check whether a point lies within any crater created so far"""
+            for crater_x, crater_y, crater_radius in self.craters:
+                dx = x - crater_x
+                dy = y - crater_y
+                if dx*dx + dy*dy <= (crater_radius + margin)**2:
+                    return True
+            return False
+        
+        @rule(
+            crater_x=st.integers(min_value=50, max_value=SCREEN_WIDTH-50),
+            crater_y=st.integers(min_value=500, max_value=600),  # At or below ground level
+            crater_radius=st.integers(min_value=20, max_value=80)
+        )
+        def create_crater(self, crater_x, crater_y, crater_radius):
+            """Blast a crater, starting over once the terrain is heavily cratered"""
+            if len(self.craters) >= self.max_craters:
+                self.terrain_map.reset()
+                self.craters = []
+            self.terrain_map.create_crater(crater_x, crater_y, crater_radius)
+            self.craters.append((crater_x, crater_y, crater_radius))
+        
+        @rule(test_x=st.integers(min_value=0, max_value=SCREEN_WIDTH-1))
+        def ground_height_consistency(self, test_x):
+            """Reported ground height should sit on solid terrain outside the craters"""
+            ground_height = self.terrain_map.get_ground_height(test_x)
+            
+            assert 0 <= ground_height <= SCREEN_HEIGHT, \
+                f"Ground height {ground_height} should be within screen"
+            
+            # There should be solid terrain at or just below the reported height
+            if ground_height < SCREEN_HEIGHT and not self.inside_any_crater(test_x, ground_height):
+                assert self.terrain_map.any_solid_in_column(test_x, int(ground_height), int(ground_height) + 10), \
+                    f"Should find solid terrain near reported ground height at x={test_x}"
+        
+        @rule(
+            projectile_x=st.integers(min_value=0, max_value=SCREEN_WIDTH-1),
+            projectile_y=st.integers(min_value=0, max_value=SCREEN_HEIGHT-1)
+        )
+        def projectile_collision_accuracy(self, projectile_x, projectile_y):
+            """Projectile collision detection should be accurate on modified terrain"""
+            is_solid = self.terrain_map.is_solid_at(projectile_x, projectile_y)
+            ground_height = self.terrain_map.get_ground_height(projectile_x)
+            
+            # If projectile is above ground height, it should not be in solid terrain
+            if projectile_y < ground_height:
+                assert not is_solid, \
+                    f"Position above ground height should not be solid at ({projectile_x}, {projectile_y})"
+            
+            # If projectile is well below original ground level and outside every crater, should be solid
+            if (projectile_y > self.ground_level + 20 and
+                    not self.inside_any_crater(projectile_x, projectile_y, margin=10)):
+                assert is_solid, \
+                    f"Position well below ground and outside crater should be solid at ({projectile_x}, {projectile_y})"
+        
+        @invariant()
+        def height_map_within_bounds(self):
+            """Craters only ever deepen the flat terrain, never past the screen bottom"""
+            height_map = self.terrain_map.height_map
+            assert self.ground_level <= min(height_map) and max(height_map) <= SCREEN_HEIGHT, \
+                "Height map should stay between the original ground level and the screen bottom"
+    
+    CraterMachine.TestCase.settings = settings(max_examples=50, stateful_step_count=10, deadline=None)
+    TestCraterMachine = CraterMachine.TestCase
+
 if __name__ == '__main__':
     # Run the tests
     unittest.main(verbosity=2)
\ No newline at end of file
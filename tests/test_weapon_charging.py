@@ -24,12 +24,39 @@ _workspace_root = os.path.dirname(_game_dir)
 if _workspace_root not in sys.path:
     sys.path.insert(0, _workspace_root)
 
-try:
-    from hypothesis import given, strategies as st, settings, assume
-    HYPOTHESIS_AVAILABLE = True
-except ImportError:
-    HYPOTHESIS_AVAILABLE = False
-    print("Warning: Hypothesis not available. Install with: pip install hypothesis")
+# SKIP_HYPOTHESIS=1 runs only the example-based tests, without importing Hypothesis
+SKIP_HYPOTHESIS = bool(os.environ.get("SKIP_HYPOTHESIS"))
+HYPOTHESIS_AVAILABLE = False
+
+if not SKIP_HYPOTHESIS:
+    try:
+        from hypothesis import given, strategies as st, settings, assume
+        from hypothesis.stateful import RuleBasedStateMachine, initialize, invariant, rule
+        from hypothesis.database import DirectoryBasedExampleDatabase
+        # "ci" keeps runs short and reproducible from a fixed seed; "dev" runs the full
+        # example count and replays shrunk failures from the on-disk example database.
+        # Profiles are process-global, so the names are prefixed to stay module-specific
+        settings.register_profile("weapon-charging-ci", max_examples=25, deadline=None,
+                                  derandomize=True, database=None)
+        settings.register_profile("weapon-charging-dev", max_examples=100, deadline=None,
+                                  database=DirectoryBasedExampleDatabase(".hypothesis/examples"))
+        PROFILE = settings.get_profile("weapon-charging-" + os.environ.get("HYPOTHESIS_PROFILE", "ci"))
+        
+        # Strategies shared by the property tests, built once at import
+        POWER_STRATEGY = st.integers(min_value=0, max_value=90)
+        # Firing draws are biased toward the minimum-power and straight-sideways/up boundaries
+        POWER_STRATEGY_FIRE = st.one_of(st.sampled_from([5, 6, 50, 99, 100]),
+                                        st.integers(min_value=5, max_value=100))
+        ANGLE_STRATEGY = st.one_of(st.sampled_from([-180.0, -90.0, 0.0]),
+                                   st.floats(min_value=-180, max_value=0))
+        LOW_POWER_STRATEGY = st.integers(min_value=15, max_value=40)
+        HIGH_POWER_STRATEGY = st.integers(min_value=60, max_value=100)
+        HYPOTHESIS_AVAILABLE = True
+    except ImportError:
+        print("Warning: Hypothesis not available. Install with: pip install hypothesis")
+
+# Property tests are only defined once Hypothesis is imported; otherwise they're reported as skipped
+PROPERTY_SKIP_REASON = "Disabled by SKIP_HYPOTHESIS" if SKIP_HYPOTHESIS else "Hypothesis not available"
 
 from main import Player, EffectsManager, SCREEN_WIDTH, SCREEN_HEIGHT
 
@@ -59,51 +86,12 @@ class TestWeaponChargingSpeed(unittest.TestCase):
         self.assertGreaterEqual(charge_rate, 8,
                                "Charge rate should be at least 8 units per frame")
     
-    @unittest.skipUnless(HYPOTHESIS_AVAILABLE, "Hypothesis not available")
-    @given(
-        initial_power=st.integers(min_value=0, max_value=90),
-        frames_to_charge=st.integers(min_value=1, max_value=10)
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_property_charging_speed(self, initial_power, frames_to_charge):
-        """
-        Property test: For any frame where power is being charged, 
-        power should increase by at least 8 units (unless capped at 100)
-        **Feature: arcade-mechanics-overhaul, Property 5: Weapon charging speed**
-        **Validates: Requirements 3.1**
-        """
-        player = Player(100, 400, 0)
-        player.power = initial_power
-        player.charging_power = True
-        
-        # Simulate charging for specified frames
-        charge_rate = 10  # Expected charge rate per design doc (increased from 5)
-        
-        for _ in range(frames_to_charge):
-            old_power = player.power
-            # Simulate one frame of charging (as done in GameManager.handle_input)
-            player.power = min(100, player.power + charge_rate)
-            
-            # If not at max and not near cap, power should have increased by at least 8
-            # When near cap (92+), the increase may be less due to capping at 100
-            if old_power < 92:  # Not near cap
-                power_increase = player.power - old_power
-                self.assertGreaterEqual(power_increase, 8,
-                                       f"Power should increase by at least 8 per frame. "
-                                       f"Got {power_increase}")
-    
     def test_max_power_reached_quickly(self):
         """Test that max power (100) is reached within reasonable frames"""
-        player = Player(100, 400, 0)
-        player.power = 0
-        player.charging_power = True
-        
         charge_rate = 10  # Expected charge rate
-        frames_to_max = 0
         
-        while player.power < 100 and frames_to_max < 20:
-            player.power = min(100, player.power + charge_rate)
-            frames_to_max += 1
+        # Charging from zero gains charge_rate per frame until capped at 100
+        frames_to_max = math.ceil(100 / charge_rate)
         
         # With charge rate of 10, should reach 100 in 10 frames
         self.assertLessEqual(frames_to_max, 13,
@@ -141,40 +129,44 @@ class TestInstantWeaponFiring(unittest.TestCase):
         self.assertFalse(player.charging_power, 
                         "Charging state should be reset after firing")
     
-    @unittest.skipUnless(HYPOTHESIS_AVAILABLE, "Hypothesis not available")
-    @given(
-        power_level=st.integers(min_value=5, max_value=100),
-        aim_angle=st.floats(min_value=-180, max_value=0)
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_property_instant_firing(self, power_level, aim_angle):
-        """
-        Property test: For any fire button release with sufficient power,
-        a projectile should be created in the same frame
-        **Feature: arcade-mechanics-overhaul, Property 6: Instant weapon firing**
-        **Validates: Requirements 3.3**
-        """
-        player = Player(100, 400, 0)
-        player.power = power_level
-        player.charging_power = True
-        player.aim_angle = aim_angle
-        
-        # Fire weapon
-        projectile = player.fire_weapon()
-        
-        # Projectile should be created immediately (same frame)
-        self.assertIsNotNone(projectile,
-                            f"Projectile should be created immediately with power {power_level}")
-        
-        # Verify projectile has correct properties
-        self.assertTrue(projectile.active,
-                       "Projectile should be active immediately")
-        
-        # Power should be reset immediately
-        self.assertEqual(player.power, 0,
-                        "Power should reset immediately after firing")
-        self.assertFalse(player.charging_power,
-                        "Charging state should reset immediately after firing")
+    if HYPOTHESIS_AVAILABLE:
+        @given(
+            power_level=POWER_STRATEGY_FIRE,
+            aim_angle=ANGLE_STRATEGY
+        )
+        @settings(PROFILE, max_examples=20)
+        def test_property_instant_firing(self, power_level, aim_angle):
+            """
+            Property test: For any fire button release with sufficient power,
+            a projectile should be created in the same frame
+            **Feature: arcade-mechanics-overhaul, Property 6: Instant weapon firing**
+            **Validates: Requirements 3.3**
+            """
+            # Reuse the setUp player, restored to its starting state for each example
+            player = self.player
+            player.reset(100, 400)
+            player.power = power_level
+            player.charging_power = True
+            player.aim_angle = aim_angle
+            
+            # Fire weapon
+            projectile = player.fire_weapon()
+            
+            # Projectile should be created immediately (same frame)
+            self.assertIsNotNone(projectile,
+                                f"Projectile should be created immediately with power {power_level}")
+            
+            # Verify projectile has correct properties
+            self.assertTrue(projectile.active,
+                           "Projectile should be active immediately")
+            
+            # Power should be reset immediately
+            self.assertEqual(player.power, 0,
+                            "Power should reset immediately after firing")
+            self.assertFalse(player.charging_power,
+                            "Charging state should reset immediately after firing")
+    else:
+        test_property_instant_firing = unittest.skip(PROPERTY_SKIP_REASON)(lambda self: None)
     
     def test_minimum_power_required(self):
         """Test that minimum power is required to fire"""
@@ -196,98 +188,134 @@ class TestChargingVisualFeedback(unittest.TestCase):
     **Validates: Requirements 3.4**
     """
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the low/high power effects managers once; the scaling property clears them per draw"""
+        cls.effects_low = EffectsManager()
+        cls.effects_high = EffectsManager()
+    
     def setUp(self):
         """Set up test fixtures"""
         self.effects_manager = EffectsManager()
     
-    def test_visual_feedback_at_thresholds(self):
-        """Test that visual feedback exists at power thresholds (Requirement 3.4)"""
-        # Test at different power thresholds: 25%, 50%, 75%, 100%
-        thresholds = [25, 50, 75, 100]
+    def test_visual_feedback_at_power_levels(self):
+        """Test visual feedback at fixed power levels, from none at very low power to enhanced above 70% (Requirement 3.4)"""
+        # (power level, minimum particles, maximum particles or None, reason)
+        cases = [
+            (5, 0, 0, "no visual feedback at very low power (< 10)"),
+            (25, 1, None, "visual feedback at 25% power"),
+            (50, 1, None, "visual feedback at 50% power"),
+            (75, 1, None, "visual feedback at 75% power"),
+            (80, 4, None, "enhanced visual feedback (central glow) at high power (> 70%)"),
+            (100, 1, None, "visual feedback at 100% power"),
+        ]
         
-        for threshold in thresholds:
-            self.effects_manager.clear_all_effects()
+        effects = self.effects_manager
+        for power_level, min_particles, max_particles, reason in cases:
+            with self.subTest(power_level=power_level):
+                effects.clear_all_effects()
+                effects.create_weapon_charge_effect(100, 100, power_level)
+                total_particles = effects.get_particle_count()
+                
+                self.assertGreaterEqual(total_particles, min_particles, f"Should have {reason}")
+                if max_particles is not None:
+                    self.assertLessEqual(total_particles, max_particles, f"Should have {reason}")
+    
+    if HYPOTHESIS_AVAILABLE:
+        @given(
+            power_level_low=LOW_POWER_STRATEGY,
+            power_level_high=HIGH_POWER_STRATEGY
+        )
+        @settings(PROFILE)
+        def test_property_visual_feedback_scaling(self, power_level_low, power_level_high):
+            """
+            Property test: For any power level, visual effect intensity should 
+            increase proportionally with power
+            **Feature: arcade-mechanics-overhaul, Property 7: Charging visual feedback scaling**
+            **Validates: Requirements 3.4**
+            """
+            assume(power_level_high > power_level_low + 20)  # Ensure meaningful difference
             
-            # Create charge effect at threshold
-            self.effects_manager.create_weapon_charge_effect(100, 100, threshold)
+            # Test low power level
+            effects_low = self.effects_low
+            effects_low.clear_all_effects()
+            effects_low.create_weapon_charge_effect(100, 100, power_level_low)
+            particles_low = effects_low.get_particle_count()
             
-            # Should have created particles
-            total_particles = sum(
-                len(system.particles) 
-                for system in self.effects_manager.particle_systems.values()
-            )
+            # Test high power level
+            effects_high = self.effects_high
+            effects_high.clear_all_effects()
+            effects_high.create_weapon_charge_effect(100, 100, power_level_high)
+            particles_high = effects_high.get_particle_count()
             
-            self.assertGreater(total_particles, 0,
-                              f"Should create visual feedback at {threshold}% power")
-    
-    @unittest.skipUnless(HYPOTHESIS_AVAILABLE, "Hypothesis not available")
-    @given(
-        power_level_low=st.integers(min_value=15, max_value=40),
-        power_level_high=st.integers(min_value=60, max_value=100)
-    )
-    @settings(max_examples=100, deadline=None)
-    def test_property_visual_feedback_scaling(self, power_level_low, power_level_high):
+            # Higher power should create more or equal particles (intensity scaling)
+            self.assertGreaterEqual(particles_high, particles_low,
+                                   f"Higher power ({power_level_high}%) should create >= particles "
+                                   f"than lower power ({power_level_low}%). "
+                                   f"Got {particles_high} vs {particles_low}")
+    else:
+        test_property_visual_feedback_scaling = unittest.skip(PROPERTY_SKIP_REASON)(lambda self: None)
+
+
+if HYPOTHESIS_AVAILABLE:
+    class ChargingMachine(RuleBasedStateMachine):
         """
-        Property test: For any power level, visual effect intensity should 
-        increase proportionally with power
-        **Feature: arcade-mechanics-overhaul, Property 7: Charging visual feedback scaling**
-        **Validates: Requirements 3.4**
+        Property 5 as a stateful test: for any sequence of charging frames and
+        releases, each charging frame should increase power by at least 8 units
+        (unless capped at 100)
+        **Feature: arcade-mechanics-overhaul, Property 5: Weapon charging speed**
+        **Validates: Requirements 3.1**
         """
-        assume(power_level_high > power_level_low + 20)  # Ensure meaningful difference
-        
-        # Test low power level
-        effects_low = EffectsManager()
-        effects_low.create_weapon_charge_effect(100, 100, power_level_low)
-        particles_low = sum(
-            len(system.particles) 
-            for system in effects_low.particle_systems.values()
-        )
         
-        # Test high power level
-        effects_high = EffectsManager()
-        effects_high.create_weapon_charge_effect(100, 100, power_level_high)
-        particles_high = sum(
-            len(system.particles) 
-            for system in effects_high.particle_systems.values()
-        )
+        charge_rate = 10  # Expected charge rate per design doc (increased from 5)
+        _shared_player = None
         
-        # Higher power should create more or equal particles (intensity scaling)
-        self.assertGreaterEqual(particles_high, particles_low,
-                               f"Higher power ({power_level_high}%) should create >= particles "
-                               f"than lower power ({power_level_low}%). "
-                               f"Got {particles_high} vs {particles_low}")
-    
-    def test_no_feedback_at_very_low_power(self):
-        """Test that minimal/no feedback at very low power levels"""
-        effects = EffectsManager()
+        @initialize(initial_power=POWER_STRATEGY)
+        def start_charging(self, initial_power):
+            """Reuse the class player, restored to its starting state"""
+            if ChargingMachine._shared_player is None:
+                ChargingMachine._shared_player = Player(100, 400, 0)
+            self.player = ChargingMachine._shared_player
+            self.player.reset(100, 400)
+            self.player.power = initial_power
+            self.player.charging_power = True
         
-        # At power level 5 (below threshold of 10)
-        effects.create_weapon_charge_effect(100, 100, 5)
+        @rule()
+        def charge_frame(self):
+            """Simulate one frame of charging (as done in GameManager.handle_input)"""
+            old_power = self.player.power
+            self.player.power = min(100, old_power + self.charge_rate)
+            
+            # When near cap (92+), the increase may be less due to capping at 100
+            if old_power < 92:
+                power_increase = self.player.power - old_power
+                assert power_increase >= 8, \
+                    f"Power should increase by at least 8 per frame. Got {power_increase}"
         
-        total_particles = sum(
-            len(system.particles) 
-            for system in effects.particle_systems.values()
-        )
+        @rule()
+        def release(self):
+            """Release the fire button and start charging again from the reset power"""
+            power = self.player.power
+            fired = power >= 5
+            projectile = self.player.fire_weapon()
+            assert (projectile is not None) == fired, \
+                f"Release should fire exactly when power is at least 5, power was {power}"
+            if fired:
+                assert self.player.power == 0, "Power should reset after firing"
+            self.player.charging_power = True
         
-        # Should have no or minimal particles at very low power
-        self.assertEqual(total_particles, 0,
-                        "Should have no visual feedback at very low power (< 10)")
+        @invariant()
+        def power_within_bounds(self):
+            """Power never leaves the 0-100 range"""
+            assert 0 <= self.player.power <= 100, f"Power {self.player.power} should stay within 0-100"
     
-    def test_enhanced_feedback_at_high_power(self):
-        """Test that enhanced feedback (central glow) appears at high power (> 70%)"""
-        effects = EffectsManager()
-        
-        # At power level 80 (above 70% threshold)
-        effects.create_weapon_charge_effect(100, 100, 80)
-        
-        total_particles = sum(
-            len(system.particles) 
-            for system in effects.particle_systems.values()
-        )
-        
-        # Should have multiple particles including central glow
-        self.assertGreater(total_particles, 3,
-                          "Should have enhanced visual feedback at high power (> 70%)")
+    ChargingMachine.TestCase.settings = settings(PROFILE, stateful_step_count=10)
+    TestChargingMachine = ChargingMachine.TestCase
+else:
+    @unittest.skip(PROPERTY_SKIP_REASON)
+    class TestChargingMachine(unittest.TestCase):
+        def runTest(self):
+            pass
 
 
 if __name__ == '__main__':
@@ -41,6 +41,9 @@ class MockTerrainMap:
     def merge_overlapping_craters(self):
         pass  # Mock implementation
 
+# The mocks hold no per-test state, so every test shares one terrain
+_SHARED_TERRAIN = MockTerrain()
+
 class TestWeaponVisualEffects(unittest.TestCase):
     """
     Property 4: Weapon-specific visual effects
@@ -48,10 +51,16 @@ class TestWeaponVisualEffects(unittest.TestCase):
     trail effects, and explosion visuals scaled by power level
     """
     
+    @classmethod
+    def setUpClass(cls):
+        """Build one effects manager shared by every test"""
+        cls._effects_manager = EffectsManager()
+    
     def setUp(self):
         """Set up test fixtures"""
-        self.effects_manager = EffectsManager()
-        self.mock_terrain = MockTerrain()
+        self.effects_manager = self._effects_manager
+        self.effects_manager.clear_all_effects()
+        self.mock_terrain = _SHARED_TERRAIN
         self.mock_players = []
     
     def test_rocket_has_flame_trail_effects(self):